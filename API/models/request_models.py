@@ -1,124 +1,138 @@
-"""
-MODELS
-    POST requests data models.
-
-DESCRIPTION
-  Naming
-    Request model should start with `M_` representing `Model`
-    and name of request they are used in. For easier code modifications
-    Each POST request should have its own model even if it has the same
-    attributes as other.
-
-  Keys
-    Requests sent from client must contain exactly the same keys.
-      `key_name: datatype`
-    or, to make it optional
-      `key_name: Optional[datatype]`
-
-  _Auth
-    The _Auth class contains data used in authorization process.
-    You can inherit from this class to ensure auth data in request.
-"""
-from pydantic import BaseModel
-from typing import Optional
-
-
-class _Auth:
-    db_key: str
-    session_id: str
-
-
-# -- ACCOUNTS --
-
-class M_CreateAccount(BaseModel):
-    username: str
-    password: str
-
-class M_ChangeAccountPassword(_Auth, BaseModel):
-    current: str
-    new: str
-
-class M_DeleteAccount(_Auth, BaseModel):
-    password: str
-
-class M_AccountLogin(BaseModel):
-    username: str
-    password: str
-
-class M_AccountData(_Auth, BaseModel):
-    pass
-
-class M_AccountLogout(_Auth, BaseModel):
-    pass
-
-class M_AllowFriendRequests(_Auth, BaseModel):
-    state: int
-
-class M_SendFriendRequest(_Auth, BaseModel):
-    username: str
-
-class M_AcceptFriendRequest(_Auth, BaseModel):
-    request_id: str
-
-class M_RejectFriendRequest(_Auth, BaseModel):
-    request_id: str
-
-
-# -- DMS --
-    
-class M_LoadDirectMessages(_Auth, BaseModel):
-    target_username: str
-
-class M_SendDirectMessage(_Auth, BaseModel):
-    target_username: str
-    content: str
-
-class M_RemoveDirectMessage(_Auth, BaseModel):
-    target_username: str
-    message_id: str
-
-class M_EditDirectMessage(_Auth, BaseModel):
-    target_username: str
-    message_id: str
-    new_content: str
-
-
-# -- ROOMS --
-
-class M_CreateRoom(_Auth, BaseModel):
-    name: str
-    max_users: int = 5
-    password: Optional[str] = None
-
-class M_JoinRoom(_Auth, BaseModel):
-    room_code: str
-    password: Optional[str] = None
-
-class M_UploadFile(_Auth, BaseModel):
-    room_code: str
-
-class M_ConnectRoom(_Auth, BaseModel):
-    room_code: str
-
-class M_LockRoom(_Auth, BaseModel):
-    room_code: str
-    state: int
-
-class M_DownloadFile(_Auth, BaseModel):
-    room_code: str
-    fileid: str
-
-class M_AddMessage(_Auth, BaseModel):
-    room_code: str
-    content: str
-
-class M_LeaveRoom(_Auth, BaseModel):
-    room_code: str
-
-class M_KickMember(_Auth, BaseModel):
-    room_code: str
-    member_name: str
-
-class M_RemoveFile(_Auth, BaseModel):
-    room_code: str
-    fileid: str
+"""
+MODELS
+    POST requests data models.
+
+DESCRIPTION
+  Naming
+    Request model should start with `M_` representing `Model`
+    and name of request they are used in. For easier code modifications
+    Each POST request should have its own model even if it has the same
+    attributes as other.
+
+  Keys
+    Requests sent from client must contain exactly the same keys.
+      `key_name: datatype`
+    or, to make it optional
+      `key_name: Optional[datatype]`
+
+  _Auth
+    The _Auth class contains data used in authorization process.
+    You can inherit from this class to ensure auth data in request.
+"""
+from modules import direct_messages
+
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated, Literal, Optional
+
+
+USERNAME = Annotated[str, StringConstraints(min_length=5, max_length=16)]
+PASSWORD = Annotated[str, StringConstraints(min_length=5)]
+ROOM_NAME = Annotated[str, StringConstraints(min_length=5, max_length=16)]
+MESSAGE_CONTENT = Annotated[str, StringConstraints(max_length=1024)]
+DM_CONTENT = Annotated[str, StringConstraints(max_length=direct_messages.MESSAGE_CONTENT_LENGTH_LIMIT)]
+
+# db_keys are SHA1 hexdigests and session ids are uuid4 hexes, so malformed
+# values can be rejected by one compiled regex before any database access.
+DB_KEY = Annotated[str, StringConstraints(pattern="^[0-9a-f]{40}$")]
+SESSION_ID = Annotated[str, StringConstraints(pattern="^[0-9a-f]{32}$")]
+
+
+class _Auth(BaseModel):
+    db_key: DB_KEY
+    session_id: SESSION_ID
+
+
+# -- ACCOUNTS --
+
+class M_CreateAccount(BaseModel):
+    username: USERNAME
+    password: PASSWORD
+
+class M_ChangeAccountPassword(_Auth):
+    current: str
+    new: PASSWORD
+
+class M_DeleteAccount(_Auth):
+    password: str
+
+class M_AccountLogin(BaseModel):
+    username: str
+    password: str
+
+class M_AccountData(_Auth):
+    pass
+
+class M_AccountLogout(_Auth):
+    pass
+
+class M_AllowFriendRequests(_Auth):
+    state: Literal[0, 1]
+
+class M_SendFriendRequest(_Auth):
+    username: str
+
+class M_AcceptFriendRequest(_Auth):
+    request_id: str
+
+class M_RejectFriendRequest(_Auth):
+    request_id: str
+
+
+# -- DMS --
+    
+class M_LoadDirectMessages(_Auth):
+    target_username: str
+
+class M_SendDirectMessage(_Auth):
+    target_username: str
+    content: DM_CONTENT
+
+class M_RemoveDirectMessage(_Auth):
+    target_username: str
+    message_id: str
+
+class M_EditDirectMessage(_Auth):
+    target_username: str
+    message_id: str
+    new_content: DM_CONTENT
+
+
+# -- ROOMS --
+
+class M_CreateRoom(_Auth):
+    name: ROOM_NAME
+    max_users: int = 5
+    password: Optional[str] = None
+
+class M_JoinRoom(_Auth):
+    room_code: str
+    password: Optional[str] = None
+
+class M_UploadFile(_Auth):
+    room_code: str
+
+class M_ConnectRoom(_Auth):
+    room_code: str
+
+class M_LockRoom(_Auth):
+    room_code: str
+    state: Literal[0, 1]
+
+class M_DownloadFile(_Auth):
+    room_code: str
+    fileid: str
+
+class M_AddMessage(_Auth):
+    room_code: str
+    content: MESSAGE_CONTENT
+
+class M_LeaveRoom(_Auth):
+    room_code: str
+
+class M_KickMember(_Auth):
+    room_code: str
+    member_name: str
+
+class M_RemoveFile(_Auth):
+    room_code: str
+    fileid: str
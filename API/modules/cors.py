@@ -0,0 +1,76 @@
+"""
+MODULE
+    cors.py
+
+DESCRIPTION
+    Minimal ASGI CORS middleware for the wildcard setup this API uses.
+
+    Starlette's CORSMiddleware rebuilds header values (origin scans,
+      ','.join of methods/headers) on every request even though with
+      allow_origins=["*"] the emitted headers never change.
+    This middleware assembles both header sets once at init and writes
+      the frozen lists straight into the response start event.
+"""
+
+# Oversized Access-Control-Request-Headers values are a known allocation
+# DoS vector on wildcard CORS setups; preflights above this cap are rejected
+# before the value is ever parsed.
+MAX_ACRH_LENGTH = 8192
+
+
+class WildcardCORSMiddleware:
+    """
+    Answers preflight OPTIONS requests directly and appends the
+    precomputed CORS headers to every other HTTP response.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+        self._simple_headers = [
+            (b"access-control-allow-origin", b"*"),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+        self._preflight_headers = self._simple_headers + [
+            (b"access-control-allow-methods", b"*"),
+            (b"access-control-allow-headers", b"*"),
+            (b"access-control-max-age", b"600"),
+        ]
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = scope.get("headers") or ()
+
+        is_preflight = scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in headers
+        )
+        if is_preflight:
+            acrh_length = sum(
+                len(value) for name, value in headers
+                if name == b"access-control-request-headers"
+            )
+            if acrh_length > MAX_ACRH_LENGTH:
+                await send({
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": []
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": self._preflight_headers
+            })
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers") or []) + self._simple_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
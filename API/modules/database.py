@@ -33,8 +33,9 @@ from models import db_models
 from modules import timestamp
 from modules import logs
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, List, Iterable
+import threading
 import hashlib
 import uuid
 import json
@@ -43,6 +44,9 @@ import json
 UNDEFINED_DEFAULT_VALUE = db_models.NOT_REQUIRED
 SET_AFTER_INIT = "_SET_AFTER_INIT"
 
+# Mutations above this count trigger a snapshot rewrite and WAL truncation.
+WAL_COMPACT_THRESHOLD = 1000
+
 
 class KeyNotFound(Exception):
     """
@@ -58,29 +62,17 @@ class RequiredValueNotProvided(Exception):
     """
 
 
-def parse_key_provider(key_provider: str, model) -> str:
-    """ Create db_key from model and it's key_provider. """
+def parse_key_provider(key_provider: str) -> tuple[bool, bool, tuple[str, ...]]:
+    """ Parse key_provider string into (is_uuid, no_hash, attribute names). """
     if key_provider == db_models.KEY_AS_UUID4:
-        return uuid.uuid4().hex
+        return True, False, ()
 
     no_hash = key_provider.startswith("!")
     key_provider = key_provider.removeprefix("!")
-
-    if "+" in key_provider:
-        attributes = key_provider.split("+")
-        key_seed = ""
-        for attr in attributes:
-            key_seed += getattr(model, attr)
-    else:
-        key_seed = getattr(model, key_provider)
-
-    if no_hash:
-        return key_seed
-    
-    return hashlib.sha1(key_seed.encode()).hexdigest()
+    return False, no_hash, tuple(key_provider.split("+"))
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """
     Representation of single model's key.
@@ -137,6 +129,22 @@ class Database:
         self.dump_on_error = self.__model.dump_on_error
         self.columns: dict[str, Column] = {}
 
+        # Parsed file content, loaded lazily on first access. This process is
+        # the only writer, so the dict stays the source of truth. Mutations
+        # are appended to a write-ahead log next to the snapshot file and the
+        # snapshot is only rewritten on compaction.
+        self._content: dict = None
+        self._wal_path = self.filepath + ".wal"
+        self._wal_entries = 0
+        # Mutations come from both the event loop and threadpool workers,
+        # so appends and compaction must not interleave (a compaction racing
+        # an append could drop the entry from snapshot and truncated WAL).
+        self._wal_lock = threading.RLock()
+
+        # Parsed once so key creation doesn't re-parse the provider string
+        # on every insert.
+        self._key_is_uuid, self._key_no_hash, self._key_attrs = parse_key_provider(self.key_provider)
+
         if self.name in Database.register:
             logs.database_logger.log(self.name, f"Database: {self.name} is already initialized.")
             self = Database.register.get(self.name)
@@ -169,7 +177,7 @@ class Database:
         """ Check and create blank DB file if not exists. """
         if not self.filepath.exists():
             self.filepath.touch()
-            self.filepath.save_json_content({})
+            self.__save_db_content({})
             return
 
         try:
@@ -182,11 +190,121 @@ class Database:
             corrupted_content = self.filepath.read()
             dumpfile_content = f"\n\n--- DUMP: {timestamp.generate_timestamp()} ---\n" + corrupted_content
             (self.filepath + ".dump").touch().write(dumpfile_content)
-            self.filepath.save_json_content({})
+            self.__save_db_content({})
 
     def __get_db_content(self) -> dict:
-        """ Get and return database's file content as dict. """
-        return self.filepath.get_json_content()
+        """ Get database's content, reading and parsing the file only on first access. """
+        if self._content is None:
+            self._content = self.filepath.get_json_content()
+            self.__replay_wal()
+        return self._content
+
+    def __save_db_content(self, db_content: dict) -> None:
+        """ Persist content to database's file and keep it as the cached state. """
+        self._content = db_content
+        self.filepath.save_json_content(db_content)
+
+    def __replay_wal(self) -> None:
+        """
+        Apply write-ahead log entries left from a previous run, then compact.
+        Replay stops at the first unparseable line - a crash mid-append
+          leaves a torn tail, and everything before it is still valid.
+          Bad lines must never reach the snapshot dump/reset handler.
+        """
+        if not self._wal_path.exists():
+            return
+
+        entries = self._wal_path.read().splitlines()
+        if not entries:
+            return
+
+        replayed = 0
+        for line in entries:
+            try:
+                entry = json.loads(line)
+                key, operation = entry["k"], entry["op"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logs.database_logger.log(self.name, f"Truncating WAL at torn entry (replayed: {replayed}/{len(entries)}).")
+                break
+
+            if operation == "put":
+                self._content[key] = entry.get("v")
+            else:
+                self._content.pop(key, None)
+            replayed += 1
+
+        logs.database_logger.log(self.name, f"Replayed {replayed} WAL entries.")
+        self.compact()
+
+    def __append_wal(self, entry: dict) -> None:
+        """
+        Record single mutation in the write-ahead log.
+        Compacts once enough entries accumulate.
+        """
+        with self._wal_lock:
+            self._wal_path.write(json.dumps(entry) + "\n")
+            self._wal_entries += 1
+            if self._wal_entries >= WAL_COMPACT_THRESHOLD:
+                self.compact()
+
+    def compact(self) -> None:
+        """ Rewrite the snapshot file from current content and reset the log. """
+        with self._wal_lock:
+            self.__save_db_content(self.__get_db_content())
+            self._wal_path.write("", mode="w")
+            self._wal_entries = 0
+
+    def __make_key(self, model: db_models.DBModel) -> str:
+        """ Create db_key for model using the pre-parsed key provider. """
+        if self._key_is_uuid:
+            return uuid.uuid4().hex
+
+        key_seed = "".join(getattr(model, attr) for attr in self._key_attrs)
+        if self._key_no_hash:
+            return key_seed
+
+        return hashlib.sha1(key_seed.encode()).hexdigest()
+
+    def __build_model(self, key: str, object_content: dict) -> db_models.DBModel:
+        """
+        Build model object from entry's content without re-running the
+        dataclass init - rows were validated when written.
+        List values are copied so models never alias the cached content.
+        """
+        model_object = object.__new__(self.__model.model_cls)
+        model_object.__dict__ = {
+            name: value.copy() if isinstance(value, list) else value
+            for name, value in object_content.items()
+        }
+
+        # Rows written before a column was added to the model lack it.
+        for name, column in self.columns.items():
+            if name not in model_object.__dict__:
+                model_object.__dict__[name] = column.prepare_value(None)
+
+        model_object._key = key
+        return model_object
+
+    def __validate_column_value(self, column: Column, value: Any) -> tuple[bool, Any]:
+        """
+        Prepare and validate single value against it's column.
+        Returns (passed, value) where value may be the column's fallback.
+        """
+        value = column.prepare_value(value)
+        if column.validate(value):
+            return True, value
+
+        logs.database_logger.log(self.name, f"Value: <{value}> did not pass column's validation.")
+
+        if column.default != UNDEFINED_DEFAULT_VALUE:
+            logs.database_logger.log(self.name, f"Replaced <{value}> with default value.")
+            return True, column.default
+
+        if self.allow_invalid_values:
+            logs.database_logger.log(self.name, f"Column: {repr(column)} have no default value. Using type's default as it is allowed.")
+            return True, column.type_()
+
+        return False, value
 
     def __save_model(self, model: db_models.DBModel, db_key: str = None) -> str:
         """
@@ -195,33 +313,26 @@ class Database:
         Returns database key.
         """
         if db_key is None:
-            db_key = parse_key_provider(self.key_provider, model)
+            db_key = self.__make_key(model)
 
         content = {}
-        for column_name, value in asdict(model).items():
-            column = self.columns.get(column_name)
-            value = column.prepare_value(value)
-
-            if not column.validate(value):
-                logs.database_logger.log(self.name, f"Value: <{value}> did not pass column's validation.")
-
-                if column.default != UNDEFINED_DEFAULT_VALUE:
-                    value = column.default
-                    logs.database_logger.log(self.name, f"Replaced <{value}> with default value.")
-
-                elif self.allow_invalid_values:
-                    value = column.type_()
-                    logs.database_logger.log(self.name, f"Column: {repr(column)} have no default value. Using type's default as it is allowed.")
-                    
-                else:
-                    logs.database_logger.log(self.name, f"Column: {repr(column)} have no default value. Invalid values are not allowed. Model will not be saved.")
-                    return
+        for column_name, column in self.columns.items():
+            value = getattr(model, column_name)
+            # Shallow copy instead of asdict's full deep copy - entry values
+            # are flat, only list fields need to be detached from the model.
+            if isinstance(value, list):
+                value = value.copy()
+
+            passed, value = self.__validate_column_value(column, value)
+            if not passed:
+                logs.database_logger.log(self.name, f"Column: {repr(column)} have no default value. Invalid values are not allowed. Model will not be saved.")
+                return
 
             content[column_name] = value
 
         db_content = self.__get_db_content()
         db_content[db_key] = content
-        self.filepath.save_json_content(db_content)
+        self.__append_wal({"op": "put", "k": db_key, "v": content})
         return db_key
 
     def insert(self, data: db_models.DBModel) -> str:
@@ -243,20 +354,28 @@ class Database:
         if iter_append and iter_pop:
             logs.database_logger.log(self.name, "method called with both iter_append and iter_pop flags!")
             return
-        
-        model_object = self.get(key)
+
+        db_content = self.__get_db_content()
+        entry = db_content.get(key)
+        if entry is None:
+            logs.database_logger.log(self.name, f"({self.name}) KeyNotFound: {key}")
+            raise KeyNotFound(f"db: {self.name} key: {key}")
+
+        # Only changed fields are validated and written - untouched columns
+        # were already validated when their values were stored.
         for key_name, value in changes.items():
-            if not hasattr(model_object, key_name):
+            column = self.columns.get(key_name)
+            if column is None:
                 logs.database_logger.log(self.name, f"Cannot change value of {key_name} (key not found)")
                 continue
 
             if iter_append and isinstance(value, Iterable):
-                current_data = getattr(model_object, key_name)
+                current_data = entry.get(key_name)
                 if isinstance(current_data, list):
                     value = current_data + [value]
 
             if iter_pop and isinstance(value, Iterable):
-                current_data = getattr(model_object, key_name)
+                current_data = entry.get(key_name)
                 if isinstance(current_data, list):
                     if value in current_data:
                         current_data.remove(value)
@@ -264,10 +383,15 @@ class Database:
                     else:
                         logs.database_logger.log(self.name, f"Cannot iter_pop {value} from {key_name} (not found)")
                         return
-                    
-            setattr(model_object, key_name, value)
 
-        self.__save_model(model_object, key)
+            passed, value = self.__validate_column_value(column, value)
+            if not passed:
+                logs.database_logger.log(self.name, f"Column: {repr(column)} have no default value. Invalid values are not allowed. Entry will not be updated.")
+                return
+
+            entry[key_name] = value
+
+        self.__append_wal({"op": "put", "k": key, "v": entry})
 
     def delete(self, key: str) -> None:
         """ Delete key-value pair from database. """
@@ -276,7 +400,7 @@ class Database:
             raise KeyNotFound(f"db: {self.name} key: {key}")
         
         db_content.pop(key)
-        self.filepath.save_json_content(db_content)
+        self.__append_wal({"op": "del", "k": key})
 
     def get(self, key: str) -> db_models.DBModel:
         """
@@ -289,20 +413,32 @@ class Database:
             logs.database_logger.log(self.name, f"({self.name}) KeyNotFound: {key}")
             raise KeyNotFound(f"db: {self.name} key: {key}")
 
-        model_object = self.__model(**object_content)
-        model_object._key = key
-        return model_object
+        return self.__build_model(key, object_content)
+
+    def has_key(self, key: str) -> bool:
+        """ Check if key exists in database without materializing the full key list. """
+        return key in self.__get_db_content()
+
+    def get_many(self, keys: Iterable) -> dict[str, db_models.DBModel]:
+        """
+        Get multiple objects by their keys using a single database read.
+        Keys missing from database are silently skipped.
+        """
+        db_content = self.__get_db_content()
+        models = {}
+        for key in keys:
+            object_content = db_content.get(key)
+            if object_content is None:
+                continue
+
+            models[key] = self.__build_model(key, object_content)
+
+        return models
 
     def get_all_models(self) -> List[db_models.DBModel]:
         """ Get all models saved in database. """
-        objects = []
         db_content = self.__get_db_content()
-        for key, content in db_content.items():
-            model = self.__model(**content)
-            model._key = key
-            objects.append(model)
-
-        return objects
+        return [self.__build_model(key, content) for key, content in db_content.items()]
     
     def get_all_keys(self) -> List[str]:
         """ Get all keys saved in database. """
@@ -12,6 +12,8 @@ from modules import users
 from modules import logs
 
 from dataclasses import dataclass
+from functools import lru_cache
+from collections import deque
 import hashlib
 import json
 
@@ -27,6 +29,7 @@ class MessageNotFound(Exception):
     """
 
 
+@lru_cache(maxsize=4096)
 def create_relation_id(user_a_db_key: str, user_b_db_key: str) -> str:
     """ Create two users relation id. It does not matter which db_key comes first. """
     hash_a = sum([ord(char) for char in user_a_db_key])
@@ -153,8 +156,12 @@ class RelationStackManager:
     def __init__(self, relation_id: str) -> None:
         self.relation_id = relation_id
         self.file_path = (DMS_DATA_PATH / relation_id) + ".json"
-        self.messages_stack: list[Message] = []
-        self.__message_ids_history = [] # Prevents sendMessage spam
+        # Keyed by message id (insertion ordered) so id lookups don't scan.
+        self.messages_stack: dict[str, Message] = {}
+        # Prevents sendMessage spam. The deque keeps the newest ids and
+        # evicts the oldest; the set mirrors it for O(1) membership checks.
+        self.__recent_ids: deque[str] = deque(maxlen=32)
+        self.__recent_ids_set: set[str] = set()
 
         self.__ensure_file()
         self.__load_stack()
@@ -171,46 +178,47 @@ class RelationStackManager:
             for message_data in raw_stack:
                 message = Message.from_saved_dict(message_data, no_stack=True)
                 message.stack = self
-                self.messages_stack.append(message)
+                self.messages_stack[message.id] = message
 
             logs.dms_logger.log(self.relation_id, f"Loaded: {len(self.messages_stack)} messages to stack.")
 
         except json.JSONDecodeError:
             logs.dms_logger.log(self.relation_id, "Cannot read relation content (JsonDecodeError)")
-            self.messages_stack = []
+            self.messages_stack = {}
 
     def __save_stack(self) -> None:
         """ Save object's message_stack to its file. """
-        content = [msg.as_dict() for msg in self.messages_stack]
+        content = [msg.as_dict() for msg in self.messages_stack.values()]
         self.file_path.save_json_content(content)
 
     def get_message_by_id(self, message_id: str) -> Message:
         """ Get Message object from stack by it's id. """
-        for message in self.messages_stack:
-            if message.id == message_id:
-                return message
-            
-        logs.dms_logger.log(self.relation_id, f"Message not found in stack: {message_id}")
-        raise MessageNotFound
+        message = self.messages_stack.get(message_id)
+        if message is None:
+            logs.dms_logger.log(self.relation_id, f"Message not found in stack: {message_id}")
+            raise MessageNotFound
+        return message
 
     def append_message(self, message: Message) -> None:
         """ Apennd new message to stack. """
-        if message.id in self.__message_ids_history:
+        if message.id in self.__recent_ids_set:
             return
- 
-        self.__message_ids_history.append(message.id)
-        if len(self.__message_ids_history) > 5:
-            self.__message_ids_history = self.__message_ids_history[:5]
 
-        self.messages_stack.append(message)
+        if len(self.__recent_ids) == self.__recent_ids.maxlen:
+            self.__recent_ids_set.discard(self.__recent_ids[0])
+        self.__recent_ids.append(message.id)
+        self.__recent_ids_set.add(message.id)
+
+        self.messages_stack[message.id] = message
         self.__save_stack()
-        
+
 
     def remove_message(self, message_id: str) -> None:
         """ Find and remove message with provided id. Returns status. """
-        message = self.get_message_by_id(message_id)
+        if self.messages_stack.pop(message_id, None) is None:
+            logs.dms_logger.log(self.relation_id, f"Message not found in stack: {message_id}")
+            raise MessageNotFound
 
-        self.messages_stack.remove(message)
         self.__save_stack()
         logs.dms_logger.log(self.relation_id, f"Removed message: {message_id} from stack")
 
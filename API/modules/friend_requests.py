@@ -13,13 +13,31 @@ from modules import users
 from modules import logs
 
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
 
 
+@lru_cache(maxsize=4096)
 def create_db_key(author: str, target: str) -> str:
     return hashlib.sha1((author + target).encode()).hexdigest()
 
 
+# Maps target db_key -> set of request db_keys so pending-request lookups
+# don't have to scan every saved request. Built once on first use and kept
+# in sync by create_request() and remove().
+_target_index: dict[str, set[str]] | None = None
+
+
+def _get_target_index() -> dict[str, set[str]]:
+    global _target_index
+    if _target_index is None:
+        _target_index = {}
+        for model in database.friend_requests_db.get_all_models():
+            key = create_db_key(model.author, model.target)
+            _target_index.setdefault(model.target, set()).add(key)
+    return _target_index
+
+
 @dataclass
 class FriendRequest:
     author: str
@@ -43,6 +61,7 @@ class FriendRequest:
         )
 
         db_key = database.friend_requests_db.insert(model)
+        _get_target_index().setdefault(target_db_key, set()).add(db_key)
 
         friend_request_object = FriendRequest(
             author=auhtor_db_key,
@@ -72,18 +91,23 @@ class FriendRequest:
 
     @staticmethod
     def get_requests_to_account(target_db_key: str) -> list["FriendRequest"]:
-        """ Return all pending requests sent to specified target. """
-        return [
-            FriendRequest.from_model(model) 
-            for model in database.friend_requests_db.get_all_models()
-            if model.target == target_db_key
-        ]
+        """ Return all pending requests sent to specified target (index lookup, no full scan). """
+        request_keys = _get_target_index().get(target_db_key)
+        if not request_keys:
+            return []
+
+        models = database.friend_requests_db.get_many(list(request_keys))
+        return [FriendRequest.from_model(model) for model in models.values()]
         
     def remove(self) -> None:
         """ Remove friend request from DB. """
         logs.users_logger.log(self.db_key, "Removed friend request.")
         database.friend_requests_db.delete(self.db_key)
 
+        request_keys = _get_target_index().get(self.target)
+        if request_keys is not None:
+            request_keys.discard(self.db_key)
+
     def accept(self) -> None:
         """ Append users to their's friends list and remove request. """
         author_account = users.User.get_user_by_key(self.author)
@@ -18,19 +18,72 @@ DESCRIPTION
 """
 from modules.paths import Path
 
-from fastapi import Request 
+from fastapi import Request
 from datetime import datetime
-import inspect
+from functools import lru_cache
+import threading
+import queue
+import sys
 import os
 
 no_verbose = False
 
+_write_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _writer_loop() -> None:
+    """
+    Consume queued log entries and write them to console and file.
+    Runs in a daemon thread so the request path only enqueues entries
+    and never waits on disk. Entries queued up during a burst are
+    drained together and appended with one write per log file.
+    """
+    while True:
+        entries = [_write_queue.get()]
+        while True:
+            try:
+                entries.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        lines_per_logger: dict[Logger, list[str]] = {}
+        for logger, time_str, author, caller_info, content, args in entries:
+            # One malformed template or print failure must not kill the
+            # writer thread - it is the only path logs go through.
+            try:
+                if args:
+                    content = content % args
+                content = f"[{time_str}] ({author}) [{caller_info}]  {content}"
+
+                if not no_verbose:
+                    print(f"({logger.name}) {content}")
+
+                lines_per_logger.setdefault(logger, []).append(content)
+            except Exception as error:
+                print(f"(logs) Dropped malformed log entry: {error!r}")
+
+        for logger, lines in lines_per_logger.items():
+            try:
+                logger.log_path.write("\n".join(lines) + "\n")
+            except OSError as error:
+                print(f"(logs) Cannot write to: {str(logger.log_path)}: {error!r}")
+
+
+_writer_thread = threading.Thread(target=_writer_loop, daemon=True)
+_writer_thread.start()
+
 
 def get_time():
     """ Get current time and format it into: 31/12/2000 18:30:20 """
     return datetime.now().strftime("%d/%m/%Y %H:%M:%S")
 
 
+@lru_cache(maxsize=256)
+def _short_filename(path: str) -> str:
+    """ Memoized basename - the same few source files show up in every log. """
+    return os.path.basename(path)
+
+
 class Logger:
     """ Provides configurable logging abilities. """
     logs_path = Path("./")
@@ -43,27 +96,35 @@ class Logger:
         self.log_path.touch()
 
     def __get_caller_info(self):
-        """ Get information about place in code where log method was called. """
-        caller_frame = inspect.stack()[self.stack_depth]
-        filename = os.path.basename(caller_frame.filename)
-        function = caller_frame.function
-        lineno = caller_frame.lineno
+        """
+        Get information about place in code where log method was called.
+        Reads the one frame it needs via sys._getframe instead of
+          inspect.stack(), which builds FrameInfo (and reads source lines)
+          for the entire call stack on every log line.
+        """
+        try:
+            frame = sys._getframe(self.stack_depth)
+        except ValueError:
+            # Call stack is shallower than the configured depth (e.g. a
+            # module-level call) - fall back to log()'s direct caller.
+            frame = sys._getframe(2)
+        code = frame.f_code
+        function = code.co_name
         if function == "<module>":
             function = "@"
 
-        return f"{filename}.{function}#{lineno}"
+        return f"{_short_filename(code.co_filename)}.{function}#{frame.f_lineno}"
     
-    def log(self, author: str, content: str) -> None:
-        """ Save log to file and write to console if no_verbose is False. """
+    def log(self, author: str, content: str, *args) -> None:
+        """
+        Save log to file and write to console if no_verbose is False.
+        Content can be a %-style template with args passed separately;
+          templates are formatted by the writer thread, not the caller.
+        """
         if isinstance(author, Request):
             author = f"{author.client.host}:{author.client.port}"
 
-        content = f"[{get_time()}] ({author}) [{self.__get_caller_info()}]  {content}"
-
-        if not no_verbose:
-            print(f"({self.name}) {content}")
-
-        self.log_path.write(content+"\n")
+        _write_queue.put((self, get_time(), author, self.__get_caller_info(), content, args))
 
 
 Logger.logs_path = Path("./data/logs/")
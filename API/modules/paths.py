@@ -40,9 +40,9 @@ CODE SUMMARY
         - read() -> str
           Returns file's content or blank str if object is a directory.
 """
+import orjson
 import shutil
 import stat
-import json
 import os
 
 
@@ -174,9 +174,11 @@ class Path:
 
     def get_json_content(self) -> dict:
         """ Return content of a JSON file. """
-        return json.loads(self.read())
-        
+        # Raw bytes go straight to the parser - no intermediate str decode.
+        with open(self.path, "rb") as file:
+            return orjson.loads(file.read())
+
     def save_json_content(self, content: dict | list) -> None:
         """ Save provided content with JSON encoding. """
-        with open(self.path, "w") as file:
-            json.dump(content, file, indent=2, separators=(',', ': '))
+        with open(self.path, "wb") as file:
+            file.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
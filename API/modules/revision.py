@@ -10,12 +10,14 @@ import schedule
 import time
 
 from modules import database
+from modules import sessions
 from modules import users
 from modules import rooms
 from modules import logs
 
 
 REVISION_COOLDOWN_H = 6
+SESSION_CLEANUP_COOLDOWN_H = 1
 
 
 def check_all_users():
@@ -47,6 +49,7 @@ def check_all_rooms():
 
 schedule.every(REVISION_COOLDOWN_H).hours.do(check_all_users)
 schedule.every(REVISION_COOLDOWN_H).hours.do(check_all_rooms)
+schedule.every(SESSION_CLEANUP_COOLDOWN_H).hours.do(sessions.remove_expired_sessions)
 
 def pending_tasks_runner():
     while True:
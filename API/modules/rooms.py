@@ -20,8 +20,9 @@ from fastapi import UploadFile
 from functools import wraps
 from typing import List
 import hashlib
+import orjson
 import bcrypt
-import json
+import time
 import os
 
 
@@ -30,10 +31,52 @@ MAX_ROOM_DATA_SIZE = 1073741824 // 10  # tenth of GB per room
 TOTAL_DATA_SIZE = 1073741824  # one GB
 MAX_USERS_PER_ROOM = 5
 CODE_LENGTH = 6
+UPLOAD_CHUNK_SIZE = 65536
+# Room passwords are shared secrets checked on every join, so they use a
+# lower work factor than account passwords (which keep bcrypt's default 12).
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "6"))
 
 ROOM_VALIDATION_FAIL_MSG = "@ROOM_VALIDATION_FAIL"
 ROOM_VALIDATION_FAIL_RESPONSE = JSONResponse({"status": False, "err_msg": ROOM_VALIDATION_FAIL_MSG})
 
+# Maps room code -> db_key so code lookups don't have to scan every key.
+# Filled at room creation and lazily on first lookup of an unseen code.
+_code_index: dict[str, str] = {}
+
+# Serialized /rooms/roomData bodies reused between room mutations.
+# Filled by the roomData endpoint, dropped by Room.remove_room so bodies
+# of dead rooms don't outlive them. room_key -> (etag, encoded body).
+room_data_bodies: dict[str, tuple[str, bytes]] = {}
+
+# Rooms mutate often (members, lock state, last_interaction), so the TTL
+# is short and every mutator invalidates its entry explicitly.
+ROOM_CACHE_TTL_S = 2
+
+# db_key -> (expiration monotonic time, Room object).
+_rooms_cache: dict[str, tuple[float, "Room"]] = {}
+
+
+def _cache_get(db_key: str) -> "Room | None":
+    """ Get cached Room. Returns None on cache miss. """
+    entry = _rooms_cache.get(db_key)
+    if entry is None:
+        return None
+
+    expires_at, room = entry
+    if time.monotonic() > expires_at:
+        _rooms_cache.pop(db_key, None)
+        return None
+
+    return room
+
+def _cache_set(db_key: str, room: "Room") -> None:
+    """ Save Room object to cache. """
+    _rooms_cache[db_key] = (time.monotonic() + ROOM_CACHE_TTL_S, room)
+
+def _cache_pop(db_key: str) -> None:
+    """ Invalidate cached room entry. """
+    _rooms_cache.pop(db_key, None)
+
 
 def create_db_key(name: str) -> str:
     """ Hash room's name using SHA1 algorithm. """
@@ -41,7 +84,7 @@ def create_db_key(name: str) -> str:
 
 def is_name_available(name: str) -> bool:
     """ Check if name is already in use by other room. """
-    return not create_db_key(name) in database.rooms_db.get_all_keys()
+    return not database.rooms_db.has_key(create_db_key(name))
 
 def create_file_id(user_key: str, filename: str) -> str:
     """ Create file id from user's key an file's name. """
@@ -49,13 +92,7 @@ def create_file_id(user_key: str, filename: str) -> str:
 
 def get_total_space_left() -> int:
     """ Check data size from all rooms and check left space. """
-    rooms_size = 0
-    for room_path in RoomDataManager.ids_register.values():
-        for path, _, files in os.walk(str(room_path)):
-            for file in files:
-                file_path = os.path.join(path, file)
-                size += os.path.getsize(file_path)
-
+    rooms_size = sum(RoomDataManager.space_register.values())
     space_left = TOTAL_DATA_SIZE - rooms_size
     logs.rooms_logger.log("(space calculator)" ,f"Calculated total space left: {space_left}b")
     return space_left
@@ -64,17 +101,45 @@ def get_total_space_left() -> int:
 class RoomDataManager:
     """ Manage users' data in rooms. """
     ids_register: dict[str, Path] = {}
+    # Bytes used per room, kept current on upload/remove so space checks
+    # don't have to walk the data directories on every request.
+    space_register: dict[str, int] = {}
+    # Parsed messages per room, shared across manager instances so appends
+    # and roomData rebuilds don't re-read messages.json every time.
+    messages_register: dict[str, list] = {}
+    # Per-room content revision, bumped on every message/file change.
+    # roomData etags key on it so same-second mutations (invisible in
+    # last_interaction) still invalidate cached bodies.
+    revision_register: dict[str, int] = {}
 
     @staticmethod
     def rebuild_ids_register() -> None:
-        """ Iterate over all rooms_data' directories and save id's for files. """
+        """ Iterate over all rooms_data' directories and save id's and sizes for files. """
         for room_dir in ROOMS_DATA_PATH.list_dir():
+            room_size = 0
             for user_dir in room_dir.list_dir():
                 for file in user_dir.list_dir(as_str=True):
                     file_id = create_file_id(user_dir.get_name(), file)
                     file_path = user_dir / file
                     RoomDataManager.ids_register[file_id] = file_path
+                    room_size += file_path.get_size()
                     logs.rooms_logger.log("(id rebuilder)", f"Saved id: {file_id} for: {str(file_path)}")
+            RoomDataManager.space_register[room_dir.get_name()] = room_size
+
+    @staticmethod
+    def _adjust_space(room_key: str, delta: int) -> None:
+        """ Shift cached space usage of a room by delta bytes. """
+        RoomDataManager.space_register[room_key] = RoomDataManager.space_register.get(room_key, 0) + delta
+
+    @staticmethod
+    def _bump_revision(room_key: str) -> None:
+        """ Mark room's content (messages/files) as changed. """
+        RoomDataManager.revision_register[room_key] = RoomDataManager.revision_register.get(room_key, 0) + 1
+
+    @staticmethod
+    def get_revision(room_key: str) -> int:
+        """ Return current content revision of a room. """
+        return RoomDataManager.revision_register.get(room_key, 0)
 
     @staticmethod
     def get_file_path(file_id: str) -> Path | bool:
@@ -92,27 +157,28 @@ class RoomDataManager:
         self.msg_path = self.room_path / "messages.json"
         if not self.msg_path.exists():
             self.msg_path.touch()
-            with open(str(self.msg_path), "w") as file:
-                json.dump([], file)            
+            with open(str(self.msg_path), "wb") as file:
+                file.write(b"[]")
             logs.rooms_logger.log(self.room_key, "Created messages file")
 
     def __get_msg_content(self) -> List[dict]:
-        """ Returns content of messages.json file. """
-        with open(str(self.msg_path), "r") as file:
-            return json.load(file)
-        
+        """ Returns content of messages.json file (from the messages register when loaded). """
+        messages = RoomDataManager.messages_register.get(self.room_key)
+        if messages is None:
+            with open(str(self.msg_path), "rb") as file:
+                messages = orjson.loads(file.read())
+            RoomDataManager.messages_register[self.room_key] = messages
+        return messages
+
     def __save_msg_content(self, content: List[dict]) -> None:
         """ Dump content to messages file. """
-        with open(str(self.msg_path), "w+") as file:
-            json.dump(content, file)
+        with open(str(self.msg_path), "wb") as file:
+            file.write(orjson.dumps(content))
+        RoomDataManager.messages_register[self.room_key] = content
 
     def calculate_total_space(self) -> int:
-        """ Calculate total space took by user files in bytes. """
-        total_size = 0
-        for user_dir in self.room_path.list_dir():
-            for file in user_dir.list_dir():
-                total_size += file.get_size()
-        return total_size
+        """ Return total space took by user files in bytes (from the space register). """
+        return RoomDataManager.space_register.get(self.room_key, 0)
     
     def user_dir_exists(self, user_key: str) -> bool:
         """ Check if user's directory exists in this room. """
@@ -127,7 +193,10 @@ class RoomDataManager:
         """ Remove user directory. """
         path = self.room_path // user_key
         if path.exists():
+            freed_space = sum(file.get_size() for file in path.list_dir())
             path.remove()
+            RoomDataManager._adjust_space(self.room_key, -freed_space)
+            RoomDataManager._bump_revision(self.room_key)
             logs.rooms_logger.log(self.room_key, f"Removed user dir: {user_key}")
         else:
             logs.rooms_logger.log(self.room_key, f"WARN: Cannot remove user dir (not exists) for: {user_key}")
@@ -135,7 +204,8 @@ class RoomDataManager:
     def upload_file(self, user_key: str, uploaded_file: UploadFile) -> tuple[str, str] | bool:
         """ Upload file to user's directory if there is enough space. Returns upload status. """
         if uploaded_file.size is None:
-            uploaded_file.size = len(uploaded_file.file.read())
+            uploaded_file.file.seek(0, os.SEEK_END)
+            uploaded_file.size = uploaded_file.file.tell()
         if (self.calculate_total_space() + uploaded_file.size) > MAX_ROOM_DATA_SIZE:
             logs.rooms_logger.log(self.room_key, "Cannot upload file (room size limit reached.)")
             return False
@@ -158,11 +228,18 @@ class RoomDataManager:
         file_path.touch()
         with open(file_path.path, "wb+") as file:
             uploaded_file.file.seek(0)
-            content = uploaded_file.file.read()
-            file.write(content)
+            buffer = bytearray(UPLOAD_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read_bytes = uploaded_file.file.readinto(buffer)
+                if not read_bytes:
+                    break
+                file.write(view[:read_bytes])
 
         file_id = create_file_id(user_key, uploaded_file.filename)
         RoomDataManager.ids_register[file_id] = file_path
+        RoomDataManager._adjust_space(self.room_key, file_path.get_size())
+        RoomDataManager._bump_revision(self.room_key)
         logs.rooms_logger.log(self.room_key, f"Uploaded file to user directory: {uploaded_file.filename} (id: {file_id})")
         return file_id, uploaded_file.filename
 
@@ -173,8 +250,11 @@ class RoomDataManager:
             logs.rooms_logger.log(self.room_key, f"Tried to remove file id: {file_id} (id not found in register)")
             return False
         
+        file_size = path.get_size()
         path.remove()
         RoomDataManager.ids_register.pop(file_id)
+        RoomDataManager._adjust_space(self.room_key, -file_size)
+        RoomDataManager._bump_revision(self.room_key)
         logs.rooms_logger.log(self.room_key, f"Removed file: {str(path)} ({file_id})")
         return True
 
@@ -208,10 +288,14 @@ class RoomDataManager:
         file_content = self.__get_msg_content()
         file_content.append(message_object)
         self.__save_msg_content(file_content)
+        RoomDataManager._bump_revision(self.room_key)
     
     def cleanup(self) -> None:
         """ Remove all files and directories including room dir. """
         self.room_path.remove()
+        RoomDataManager.space_register.pop(self.room_key, None)
+        RoomDataManager.messages_register.pop(self.room_key, None)
+        RoomDataManager.revision_register.pop(self.room_key, None)
 
 
 @dataclass
@@ -242,11 +326,11 @@ class Room:
             logs.rooms_logger.log(name, f"Cannot create room (name in use): {name}")
             return False
         
-        if admin_key not in database.users_db.get_all_keys():
+        if not database.users_db.has_key(admin_key):
             logs.rooms_logger.log(name, f"Cannot create room (admin_key not found in users_db): {admin_key}")
             return False
 
-        if max_users not in range(1, MAX_USERS_PER_ROOM+1):
+        if not (1 <= max_users <= MAX_USERS_PER_ROOM):
             logs.rooms_logger.log(name, f"Invalid max_users value detected: {max_users}, settings to: {MAX_USERS_PER_ROOM}")
             max_users = MAX_USERS_PER_ROOM
 
@@ -278,6 +362,8 @@ class Room:
 
         db_key = database.rooms_db.insert(model)
         room.db_key = db_key
+        _code_index[room.code] = db_key
+        _cache_pop(db_key)
         logs.rooms_logger.log(room.db_key, f"Created room: {repr(room)}")
         return room
     
@@ -300,7 +386,7 @@ class Room:
     def get_room_by_name(name: str) -> "Room":
         """ Create instance of Room object by room's name. Raises database.KeyNotFound when name was not found. """
         db_key = create_db_key(name)
-        if not db_key in database.rooms_db.get_all_keys():
+        if not database.rooms_db.has_key(db_key):
             raise database.KeyNotFound
         model = database.rooms_db.get(db_key)
         return Room.from_model(model)
@@ -308,16 +394,43 @@ class Room:
     @staticmethod
     def get_room_by_code(code: str) -> "Room":
         """ Create instance of Room object by it's code. If not found, database.KeyNotFound will be raised. """
+        db_key = _code_index.get(code)
+        if db_key is not None:
+            try:
+                return Room.get_room_by_key(db_key)
+            except database.KeyNotFound:
+                _code_index.pop(code, None)
+
         for key in database.rooms_db.get_all_keys():
             if code == key[:CODE_LENGTH]:
-                return Room.from_model(database.rooms_db.get(key))
+                _code_index[code] = key
+                return Room.get_room_by_key(key)
         raise database.KeyNotFound
 
     @staticmethod
     def get_room_by_key(key: str) -> "Room":
-        """ Create instance of Room object by it's database key. database.KeyNotFound might be raised. """
-        model = database.rooms_db.get(key)
-        return Room.from_model(model)
+        """
+        Create instance of Room object by it's database key. database.KeyNotFound might be raised.
+        Results are kept in a short TTL cache; mutators invalidate their entry.
+        """
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        room = Room.from_model(database.rooms_db.get(key))
+        _cache_set(key, room)
+        return room
+
+    @staticmethod
+    def get_rooms_by_keys(keys: list[str]) -> dict[str, "Room"]:
+        """
+        Get many Room objects at once using a single database read.
+        Keys missing from database are skipped in the result.
+        """
+        return {
+            key: Room.from_model(model)
+            for key, model in database.rooms_db.get_many(keys).items()
+        }
 
     def __post_init__(self):
         self.db_key = hashlib.sha1(self.name.encode()).hexdigest()
@@ -348,6 +461,9 @@ class Room:
     def remove_room(self) -> None:
         """ Remove this room from database. Cleanup data. """
         database.rooms_db.delete(self.db_key)
+        _code_index.pop(self.code, None)
+        room_data_bodies.pop(self.db_key, None)
+        _cache_pop(self.db_key)
         self.room_data_manager.cleanup()
         logs.rooms_logger.log(self.db_key, f"Removed room: {repr(self)}")
 
@@ -355,6 +471,7 @@ class Room:
         """ Add new member to the room. """
         self.members.append(member_key)
         database.rooms_db.update(self.db_key, {"members": (member_key)}, iter_append=True)
+        _cache_pop(self.db_key)
         logs.rooms_logger.log(self.db_key, f"Added member: {member_key}")
 
     def remove_member_key(self, member_key: str) -> None:
@@ -365,6 +482,7 @@ class Room:
             
         database.rooms_db.update(self.db_key, {"members": (member_key)}, iter_pop=True)
         self.members.remove(member_key)
+        _cache_pop(self.db_key)
         self.room_data_manager.remove_user_dir(member_key)
         logs.rooms_logger.log(self.db_key, f"Removed member: {member_key}")
 
@@ -387,6 +505,7 @@ class Room:
         """ Update room's lock state. """
         self.is_locked = state
         database.rooms_db.update(self.db_key, {"is_locked": state})
+        _cache_pop(self.db_key)
         logs.rooms_logger.log(self.db_key, f"Updated room's lock state to: {state}")
 
     def update_interaction_date(self) -> None:
@@ -394,6 +513,7 @@ class Room:
         current_timestamp = timestamp.generate_timestamp()
         self.last_interaction = current_timestamp
         database.rooms_db.update(self.db_key, {"last_interaction": self.last_interaction})
+        _cache_pop(self.db_key)
         logs.rooms_logger.log(self.db_key, "Updated last_interaction field.")
 
 
@@ -427,7 +547,11 @@ def validate_room(function):
             logs.rooms_logger.log(room.db_key, "Room has expired")
             room.remove_room()
             return ROOM_VALIDATION_FAIL_RESPONSE
-        
+
+        request = kwargs.get("request")
+        if room is not None and request is not None:
+            request.state.room = room
+
         return await function(*args, **kwargs)
     return wrapper
 
@@ -88,10 +88,30 @@ class Session:
     def get_session_by_key(user_key: str) -> "Session":
         """
         Get Session object from it's database's user_key
-        Raises database.KeyNotFound error at invalid user_key 
+        Raises database.KeyNotFound error at invalid user_key
         """
         return Session.from_model(database.sessions_db.get(user_key))
 
+    @staticmethod
+    def try_get(user_key: str) -> "Session | None":
+        """ Get user's session or None when there is none - no exception control flow. """
+        if not database.sessions_db.has_key(user_key):
+            return None
+        return Session.from_model(database.sessions_db.get(user_key))
+
+    @staticmethod
+    def recreate_session(user_key: str) -> "Session":
+        """
+        Drop user's current session (valid or expired) if any exists
+        and create a fresh one. Uses a single database read.
+        """
+        stale_session = Session.try_get(user_key)
+        if stale_session is not None:
+            stale_session.drop()
+            logs.sessions_logger.log(stale_session.session_id, "Dropped previous session on login.")
+
+        return Session.create_session(user_key)
+
     def __post_init__(self):
         if self.date_expire == SET_AFTER_INIT:
             self.date_expire = timestamp.create_session_expiration_datetime(self.date_renewed)
@@ -113,8 +133,8 @@ class Session:
         logs.sessions_logger.log(self.user_key, f"Session dropped: {self.session_id}")
 
 
-def _validate_auth_data(db_key: str, session_id: str) -> bool:
-    """ Check AuthData validity. """
+def _validate_auth_data(db_key: str, session_id: str) -> "users.User | bool":
+    """ Check AuthData validity. Returns the authenticated User on success so callers can reuse it. """
     if db_key is None:
         logs.sessions_logger.log(session_id, "Cannot validate user session (db_key not provided)")
         return False
@@ -126,7 +146,10 @@ def _validate_auth_data(db_key: str, session_id: str) -> bool:
         logs.sessions_logger.log(session_id, "Cannot validate user session (invalid db_key)")
         return False
 
-    session = account.get_session()
+    session = Session.try_get(db_key)
+    if session is None:
+        logs.sessions_logger.log(session_id, "Cannot validate user session (no open session)")
+        return False
 
     if session.session_id != session_id:
         logs.sessions_logger.log(session_id, "Cannot validate user session (ids not equal)")
@@ -139,17 +162,21 @@ def _validate_auth_data(db_key: str, session_id: str) -> bool:
 
     session.renew()
     account.update_last_interaction_date()
-    return True
+    return account
 
 def validate_client(function):
     @wraps(function)
     async def wrapper(*args, **kwargs):
         data = kwargs.get("data")
-        
-        status = _validate_auth_data(data.db_key, data.session_id)
-        if not status:
+
+        account = _validate_auth_data(data.db_key, data.session_id)
+        if not account:
             return VALIDATION_FAIL_RESPONSE
-        
+
+        request = kwargs.get("request")
+        if request is not None:
+            request.state.account = account
+
         # await NotificationServer.flush_buffer(data.db_key)
         return await function(*args, **kwargs)
     return wrapper
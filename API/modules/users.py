@@ -16,6 +16,93 @@ from modules import logs
 from dataclasses import dataclass
 import hashlib
 import bcrypt
+import hmac
+import time
+import os
+
+
+USER_CACHE_TTL_S = 60
+LOGIN_CACHE_TTL_S = 300
+# last_interaction is only persisted when it moved at least this far,
+# coalescing the per-request bumps into occasional writes.
+INTERACTION_WRITE_INTERVAL_S = 30
+
+# Hard cap on cached entries - not-found markers are stored for any
+# well-formed key, so unauthenticated probes with random keys would
+# otherwise grow the cache without bound.
+USER_CACHE_MAX_ENTRIES = 2048
+
+# db_key -> (expiration monotonic time, User object or None for known-missing users).
+_users_cache: dict[str, tuple[float, "User | None"]] = {}
+
+
+def _cache_get(db_key: str) -> "User | None | bool":
+    """ Get cached User (None = cached not-found). Returns False on cache miss. """
+    entry = _users_cache.get(db_key)
+    if entry is None:
+        return False
+
+    expires_at, user = entry
+    if time.monotonic() > expires_at:
+        _users_cache.pop(db_key, None)
+        return False
+
+    return user
+
+def _cache_set(db_key: str, user: "User | None") -> None:
+    """
+    Save User object (or not-found marker) to cache.
+    When the cap is reached, expired entries are swept first and the
+      oldest inserted entries are dropped until there is room.
+    """
+    if len(_users_cache) >= USER_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in _users_cache.items() if now > expires_at]:
+            _users_cache.pop(key, None)
+        while len(_users_cache) >= USER_CACHE_MAX_ENTRIES:
+            _users_cache.pop(next(iter(_users_cache)))
+
+    _users_cache[db_key] = (time.monotonic() + USER_CACHE_TTL_S, user)
+
+def _cache_pop(db_key: str) -> None:
+    """ Invalidate cached user entry. """
+    _users_cache.pop(db_key, None)
+
+
+# Remembers recently verified logins so repeated attempts with the same
+# password skip the full bcrypt check. Passwords are never stored - only
+# their HMAC under a random per-process pepper.
+# db_key -> (peppered password digest, expiration monotonic time, bcrypt hash it verified against).
+_login_pepper = os.urandom(32)
+_login_cache: dict[str, tuple[bytes, float, str]] = {}
+
+
+def verify_login_cached(account: "User", password: str) -> bool:
+    """
+    Check account's password, skipping bcrypt when this exact password
+    was already verified within LOGIN_CACHE_TTL_S against the same hash.
+    """
+    digest = hmac.new(_login_pepper, password.encode(), "sha256").digest()
+
+    entry = _login_cache.get(account.db_key)
+    if entry is not None:
+        cached_digest, expires_at, verified_hash = entry
+        if (
+            time.monotonic() < expires_at
+            and verified_hash == account.password
+            and hmac.compare_digest(cached_digest, digest)
+        ):
+            return True
+
+    if not account.check_password(password):
+        return False
+
+    _login_cache[account.db_key] = (digest, time.monotonic() + LOGIN_CACHE_TTL_S, account.password)
+    return True
+
+def _login_cache_pop(db_key: str) -> None:
+    """ Invalidate cached login verification. """
+    _login_cache.pop(db_key, None)
 
 
 def create_db_key(username: str) -> str:
@@ -24,7 +111,7 @@ def create_db_key(username: str) -> str:
 
 def is_username_available(username: str) -> bool:
     """ Check if any saved user has provided username. """
-    return not create_db_key(username) in database.users_db.get_all_keys()
+    return not database.users_db.has_key(create_db_key(username))
 
 
 @dataclass
@@ -85,6 +172,7 @@ class User:
         db_key = database.users_db.insert(model)
         user.db_key = db_key
 
+        _cache_pop(db_key)
         logs.users_logger.log(db_key, f"Created account: {username}")
         return user
     
@@ -104,17 +192,53 @@ class User:
     @staticmethod
     def get_user_by_name(username: str) -> "User":
         """ Get User object from it's name. Raises database.KeyNotFound when user not found. """
-        if is_username_available(username):
-            raise database.KeyNotFound
-        return User.from_model(database.users_db.get(create_db_key(username)))
+        return User.get_user_by_key(create_db_key(username))
 
     @staticmethod
     def get_user_by_key(key: str) -> "User":
-        """ Get User object from it's key. Raises database.KeyNotFound when user not found.  """
-        if key not in database.users_db.get_all_keys():
+        """
+        Get User object from it's key. Raises database.KeyNotFound when user not found.
+        Results (including not-found markers) are kept in a short TTL cache
+          so endpoints fanning out into many lookups don't hit database each time.
+        """
+        cached = _cache_get(key)
+        if cached is not False:
+            if cached is None:
+                raise database.KeyNotFound
+            return cached
+
+        if not database.users_db.has_key(key):
+            _cache_set(key, None)
             raise database.KeyNotFound
-        return User.from_model(database.users_db.get(key))
-    
+
+        user = User.from_model(database.users_db.get(key))
+        _cache_set(key, user)
+        return user
+
+    @staticmethod
+    def get_users_by_keys(keys: list[str]) -> dict[str, "User"]:
+        """
+        Get many User objects at once using a single database read.
+        Keys missing from database are skipped in the result.
+        """
+        users_map = {}
+        missing_keys = []
+
+        for key in set(keys):
+            cached = _cache_get(key)
+            if cached is False:
+                missing_keys.append(key)
+            elif cached is not None:
+                users_map[key] = cached
+
+        if missing_keys:
+            for key, model in database.users_db.get_many(missing_keys).items():
+                user = User.from_model(model)
+                _cache_set(key, user)
+                users_map[key] = user
+
+        return users_map
+
     def __post_init__(self) -> None:
         self.db_key = create_db_key(self.username)
 
@@ -132,6 +256,8 @@ class User:
         
         new_password = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt()).decode()
         database.users_db.update(self.db_key, {"password": new_password})
+        _cache_pop(self.db_key)
+        _login_cache_pop(self.db_key)
         logs.users_logger.log(self.db_key, f"Password changed for: {self.username}")
         return True
     
@@ -140,54 +266,59 @@ class User:
         session = self.get_session()
         session.drop()
         database.users_db.delete(self.db_key)
+        _cache_pop(self.db_key)
+        _login_cache_pop(self.db_key)
 
     def add_active_room(self, room_id: str) -> None:
         """ Add new active room and save it to database. """
         if not room_id in self.active_rooms:
             database.users_db.update(self.db_key, {"active_rooms": room_id}, iter_append=True)
             self.active_rooms.append(room_id)
+            _cache_pop(self.db_key)
 
     def remove_active_room(self, room_id: str) -> None:
         """ Remove active room from database. """
         if room_id in self.active_rooms:
             database.users_db.update(self.db_key, {"active_rooms": room_id}, iter_pop=True)
             self.active_rooms.remove(room_id)
+            _cache_pop(self.db_key)
 
     def update_last_interaction_date(self) -> None:
-        """ Update last_interaction field in database. """
-        self.last_interaction = timestamp.generate_timestamp()
-        database.users_db.update(self.db_key, {"last_interaction": self.last_interaction})
+        """
+        Update last_interaction field in database.
+        Writes are debounced - bumps within INTERACTION_WRITE_INTERVAL_S
+          of the last persisted value are skipped, which is far finer than
+          anything reading this field (expiry checks, login notifications) needs.
+        """
+        now = timestamp.generate_timestamp()
+        if now - self.last_interaction < INTERACTION_WRITE_INTERVAL_S:
+            return
+
+        self.last_interaction = now
+        database.users_db.update(self.db_key, {"last_interaction": now})
 
     def has_valid_session(self) -> bool:
         """ Check if user has opened and valid session. """
-        try:
-            session = sessions.Session.get_session_by_key(self.db_key)
-            return not session.is_expired()
-        
-        except database.KeyNotFound:
-            return False
+        session = sessions.Session.try_get(self.db_key)
+        return session is not None and not session.is_expired()
 
     def has_expired_session(self) -> bool:
         """ Check if user has opened expired session. """
-        try:
-            session = sessions.Session.get_session_by_key(self.db_key)
-            return session.is_expired()
-        
-        except database.KeyNotFound:
-            return False
+        session = sessions.Session.try_get(self.db_key)
+        return session is not None and session.is_expired()
 
     def get_session(self) -> sessions.Session:
         """ Return existing user's session if exists or create new. """
-        try:
-            return sessions.Session.get_session_by_key(self.db_key)
-        
-        except database.KeyNotFound:
-            return sessions.Session.create_session(self.db_key)
+        session = sessions.Session.try_get(self.db_key)
+        if session is not None:
+            return session
+        return sessions.Session.create_session(self.db_key)
 
     def set_allow_friend_requests(self, state: bool) -> None:
         logs.users_logger.log(self.db_key, f"User: {self.db_key} updated allow_friend_requests state to: {state}")
         self.allow_friend_request = state
         database.users_db.update(self.db_key, {"allow_friend_requests": state})
+        _cache_pop(self.db_key)
 
     def add_friend(self, friend_db_key: str) -> None:
         """ Append friend's db_key to friends list and save changes to DB. """
@@ -195,6 +326,7 @@ class User:
             self.friends.append(friend_db_key)
 
         database.users_db.update(self.db_key, {"friends": friend_db_key}, iter_append=True)
+        _cache_pop(self.db_key)
 
     def remove_friend(self, friend_db_key: str) -> None:
         """ Remove friend's db_key from friends list and save changes to DB. """
@@ -202,6 +334,7 @@ class User:
             self.friends.remove(friend_db_key)
 
         database.users_db.update(self.db_key, {"friends": friend_db_key}, iter_pop=True)
+        _cache_pop(self.db_key)
 
     def is_expired(self) -> bool:
         """ Check if user hasn't interacted for a long time. """
@@ -31,6 +31,7 @@ from modules import logs
 
 from fastapi import WebSocket
 from typing import List
+import orjson
 
 
 class NotificationStatus:
@@ -124,16 +125,21 @@ class DashboardNotificationServer:
     @staticmethod
     async def send_room_notification(room, status: NotificationStatus, include_room_name: bool = False) -> None:
         """ Send notification to all room's members not being connected to the room. """
-        for db_key in DashboardNotificationServer.clients.keys():
+        content = {
+            "status": status,
+            "room_code": room.code
+        }
+
+        if include_room_name:
+            content.update({"room_name": room.name})
+
+        payload = orjson.dumps(content).decode()
+
+        for db_key, client_ws in DashboardNotificationServer.clients.items():
             if not room.has_member(db_key):
                 continue
-        
-            await DashboardNotificationServer.send_message_to(
-                db_key,
-                status,
-                room.code,
-                room.name if include_room_name else None
-            )
+
+            await client_ws.send_text(payload)
             logs.websocket_logger.log(room.db_key, f"Notifying client: {db_key} for room: {room.db_key}")
 
     
@@ -175,12 +181,14 @@ class InRoomEventsServer:
         logs.websocket_logger.log(self.room_key, "Removed connection from room's register.")
 
     async def send_event(self, status: str, content: dict = {}) -> None:
-        """ Send in-room update to connected clients. """
+        """ Send in-room update to connected clients. Payload is serialized once for all of them. """
+        payload = orjson.dumps({
+            "status": status.upper(),
+            "data": content
+        }).decode()
+
         for connection in self.connections:
-            await connection.send_json({
-                "status": status.upper(),
-                "data": content
-            })
+            await connection.send_text(payload)
         logs.websocket_logger.log(self.room_key, f"Sent: {status.upper()} in room event.")
         
     